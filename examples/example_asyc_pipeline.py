@@ -3,42 +3,74 @@
 Run:
   uv run python scripts/demo_async_pipeline.py  # or `python ...`
 
+Requires the `perf` extra (orjson): `pip install profilis[perf]`
+
 What it shows:
 - Creates a global AsyncCollector that writes JSONL batches to `./demo-out.jsonl`
 - Uses runtime.use_span(trace_id, span_id) to tag events
 - Fires concurrent async tasks that enqueue events without blocking
+- Producers enqueue plain tuples or pre-encoded lines, never per-event objects:
+  nothing to allocate beyond the record itself, and nothing to pool or recycle
 """
 
 from __future__ import annotations
 
 import asyncio
-import json
+import contextlib
+import io
 import os
-from dataclasses import asdict, dataclass
+import threading
+from typing import Optional, Union
 
-from profilis.core.async_collector import AsyncCollector
-from profilis.runtime import get_span_id, get_trace_id, now_ns, span_id, use_span
+import orjson
 
+from profilis.core.async_collector import AsyncCollector
+from profilis.runtime import get_ids, now_ns, span_id, use_span
 
 # -------------------- Event model --------------------
-@dataclass
-class Event:
-    ts_ns: int
-    trace_id: str | None
-    span_id: str | None
-    level: str
-    msg: str
-    attrs: dict[str, object]
-
-
-def make_event(level: str, msg: str, **attrs: object) -> Event:
-    return Event(
-        ts_ns=now_ns(),
-        trace_id=get_trace_id(),
-        span_id=get_span_id(),
-        level=level,
-        msg=msg,
-        attrs=attrs,
+# Events travel as plain tuples: the cheapest container to build (no __init__),
+# turned into dicts only when the sink encodes a batch.
+# Field order: (ts_ns, trace_id, span_id, level, msg, attrs)
+Event = tuple[int, Optional[str], Optional[str], str, str, dict[str, object]]
+# Producers with a fixed event shape may enqueue a finished JSONL line instead,
+# paired with its level so discarding still sees it: (level, line)
+Line = tuple[str, bytes]
+Record = Union[Event, Line]
+
+
+# Under pressure, routine levels may be shed; these messages never are
+_SHED_LEVELS = frozenset({"DEBUG", "INFO"})
+_KEEP_MSGS = frozenset({"demo-complete"})
+
+
+def _discardable(rec: Record) -> bool:
+    # Length tells the two apart (Event has 6 fields); a literal lets mypy narrow
+    if len(rec) == 2:  # noqa: PLR2004
+        return rec[0] in _SHED_LEVELS
+    return rec[3] in _SHED_LEVELS and rec[4] not in _KEEP_MSGS
+
+
+def _line_template(level: str, msg: str, attrs: dict[str, object], key: str) -> bytes:
+    """Pre-encode every invariant byte of an event line under the current IDs.
+
+    Returns a bytes %-template taking (ts_ns, value) where value is an int
+    stored under attrs[key]. Output matches what _encode_jsonl would produce
+    for the same event, without running a JSON encoder per event.
+    """
+    if key in attrs:
+        # The template appends key itself; a static value would duplicate it
+        raise ValueError(f"key {key!r} is already in attrs")
+    tid, sid = get_ids()
+    head = orjson.dumps({"trace_id": tid, "span_id": sid, "level": level, "msg": msg})
+    static = orjson.dumps(attrs)[1:-1]
+    tail = (static + b"," if static else b"") + orjson.dumps(key) + b":"
+    # Escape user data so only our two placeholders are interpreted
+    return (
+        b'{"ts_ns":%d,'
+        + head[1:-1].replace(b"%", b"%%")
+        + b',"attrs":{'
+        + tail.replace(b"%", b"%%")
+        + b"%d}}\n"
     )
 
 
@@ -46,24 +78,187 @@ def make_event(level: str, msg: str, **attrs: object) -> Event:
 _OUT = os.path.abspath("demo-out.jsonl")
 
 
-def _jsonl_sink(batch: list[Event]) -> None:
-    # Append a batch as JSON lines; fast and simple for a demo
-    with open(_OUT, "a", encoding="utf-8") as f:
-        for ev in batch:
-            f.write(json.dumps(asdict(ev), separators=(",", ":")) + "\n")
+def _encode_jsonl(batch: list[Record]) -> bytes:
+    """Encode a batch as one contiguous JSONL payload.
+
+    Tuples become dicts here, on the writer thread, rather than per emit;
+    pre-encoded lines pass through untouched. orjson appends the newline itself.
+    """
+    dumps = orjson.dumps
+    opt = orjson.OPT_APPEND_NEWLINE
+    parts: list[bytes] = []
+    append = parts.append
+    for rec in batch:
+        if len(rec) == 2:  # noqa: PLR2004  (level, line)
+            append(rec[1])
+            continue
+        ts, tid, sid, lvl, msg, a = rec
+        # One orjson call per event beats a fixed-key bytes template here: the
+        # template still needs an escaped encode per string field (~0.87 vs
+        # ~0.64 us/event). Fixed shapes are specialized upstream (_line_template).
+        append(
+            dumps(
+                {
+                    "ts_ns": ts,
+                    "trace_id": tid,
+                    "span_id": sid,
+                    "level": lvl,
+                    "msg": msg,
+                    "attrs": a,
+                },
+                option=opt,
+            )
+        )
+    return b"".join(parts)
+
+
+class _JSONLSink:
+    """Append batches as JSON lines from a dedicated writer thread.
+
+    Double-buffered: the collector thread encodes each batch into `active`;
+    the writer swaps it with `flushing` under a lock (a pointer swap) and
+    writes outside the lock, so encoding and disk I/O overlap. fsync runs once
+    every `sync_every` writes (group commit) rather than per batch.
 
+    Backpressure: once `active` would exceed `max_pending` bytes, new batches
+    are dropped and counted in `dropped` (records), never blocking the
+    collector. A write/sync failure is kept in `error`, later batches are
+    dropped, and close() raises it. Batches go straight to the raw fd (each is
+    already one contiguous buffer), so on failure `dropped` also covers every
+    record written since the last successful fsync: none are known durable.
+    """
 
-# Global collector (bounded, drop-oldest, batches by 128, flush every 100ms)
-collector = AsyncCollector(_jsonl_sink, queue_size=2048, batch_max=128, flush_interval=0.1)
+    def __init__(self, path: str, *, sync_every: int = 8, max_pending: int = 8 << 20) -> None:
+        # Unbuffered: no user-space copy whose contents a failure could hide
+        self._fh = io.FileIO(path, "ab")
+        self._active = bytearray()
+        self._flushing = bytearray()
+        self._lock = threading.Lock()
+        self._ready = threading.Event()
+        self._closing = False
+        self._sync_every = sync_every
+        self._max_pending = max_pending
+        self._writes = 0
+        self._unsynced = 0  # records written since the last fsync
+        self.dropped = 0
+        self.error: BaseException | None = None
+        self._thread = threading.Thread(target=self._run, name="demo-jsonl-writer", daemon=True)
+        self._thread.start()
+
+    def __call__(self, batch: list[Record]) -> None:
+        if self.error is not None:
+            with self._lock:
+                self.dropped += len(batch)
+            return
+        payload = _encode_jsonl(batch)
+        with self._lock:
+            if self.error is not None or len(self._active) + len(payload) > self._max_pending:
+                self.dropped += len(batch)
+                return
+            self._active += payload
+        self._ready.set()
+
+    def close(self) -> None:
+        # AsyncCollector.close() calls this after the final drain (and suppresses
+        # what it raises, so callers should also check `error`/`dropped`)
+        self._closing = True
+        self._ready.set()
+        self._thread.join()
+        try:
+            if self.error is None:
+                self._sync()
+        except Exception as exc:
+            self._fail(exc)
+        finally:
+            # After a failed write, close() may re-raise the buffered error
+            with contextlib.suppress(Exception):
+                self._fh.close()
+        if self.error is not None:
+            raise OSError(f"JSONL writer failed; {self.dropped} records dropped") from self.error
+
+    def _run(self) -> None:
+        while True:
+            self._ready.wait()
+            self._ready.clear()
+            # Read before swapping: once set, every batch is already in `active`
+            closing = self._closing
+            with self._lock:
+                self._active, self._flushing = self._flushing, self._active
+            if self._flushing:
+                try:
+                    self._write_all(self._flushing)
+                    self._writes += 1
+                    if self._writes % self._sync_every == 0:
+                        self._sync()
+                except Exception as exc:
+                    # Stop writing; the batches we hold are lost and counted
+                    self._fail(exc)
+                    return
+            if closing:
+                return
+
+    def _fail(self, exc: BaseException) -> None:
+        with self._lock:
+            self.error = exc
+            # One record per line: orjson never emits a raw newline inside a value
+            lost = self._flushing.count(b"\n") + self._active.count(b"\n")
+            self.dropped += self._unsynced + lost
+            self._unsynced = 0
+            self._flushing.clear()
+            self._active.clear()
+
+    def _write_all(self, data: bytearray) -> None:
+        # Raw writes may be partial: trim what the kernel took, so on failure
+        # `data` holds exactly the unwritten remainder
+        while data:
+            n = self._fh.write(data) or 0
+            self._unsynced += data.count(b"\n", 0, n)
+            del data[:n]
+
+    def _sync(self) -> None:
+        os.fsync(self._fh.fileno())
+        self._unsynced = 0
+
+
+_jsonl_sink = _JSONLSink(_OUT)
+
+
+# Global collector (bounded, drop-oldest, batches by 128, flush every 100ms).
+# Past 80% full, DEBUG/INFO events are discarded so warnings, errors and the
+# final summary still get through.
+collector = AsyncCollector(
+    _jsonl_sink,
+    queue_size=2048,
+    batch_max=128,
+    flush_interval=0.1,
+    discard=_discardable,
+    discard_threshold=0.8,
+)
+
+
+def emit(level: str, msg: str, attrs: dict[str, object] | None = None) -> None:
+    """Build and enqueue an event in one call, tagged with the current IDs.
+
+    `attrs` is stored as given (pass a literal), skipping the **kwargs repack.
+    """
+    tid, sid = get_ids()
+    collector.enqueue((now_ns(), tid, sid, level, msg, {} if attrs is None else attrs))
 
 
 # -------------------- Demo workload --------------------
 async def worker(name: str, n: int) -> None:
     # Each worker gets its own span; share a trace for the whole run
     with use_span(span_id=span_id()):
+        # Level, msg, IDs and worker name are fixed for the whole span: encode them
+        # once and only format the timestamp and counter per event.
+        level = "INFO"
+        tick = _line_template(level, "tick", {"worker": name}, "i")
+        # Bind hot-loop callables to locals to skip global/attribute lookups.
+        _now = now_ns
+        _enq = collector.enqueue
         for i in range(n):
             # Non-blocking enqueue under pressure
-            collector.enqueue(make_event("INFO", "tick", worker=name, i=i))
+            _enq((level, tick % (_now(), i)))
             # Do real work here…
             if i % 50 == 0:
                 await asyncio.sleep(0)
@@ -78,10 +273,19 @@ async def main() -> None:
             worker("C", 1000),
         )
         # Enqueue a final summary event
-        collector.enqueue(make_event("INFO", "demo-complete"))
+        emit("INFO", "demo-complete")
 
     # Ensure everything is flushed for the demo
     collector.close()
+    if collector.discarded or collector.dropped_oldest:
+        print(
+            f"Collector shed {collector.discarded} events (discard rule) and "
+            f"dropped {collector.dropped_oldest} (queue full)"
+        )
+    if _jsonl_sink.error is not None:
+        print(f"JSONL writer failed: {_jsonl_sink.error!r}")
+    if _jsonl_sink.dropped:
+        print(f"Sink dropped {_jsonl_sink.dropped} records")
     print(f"Wrote events → {_OUT}")
 
 
@@ -13,9 +13,10 @@ col = AsyncCollector[dict[str, Any]](
 em = Emitter(col)
 
 N = 10000
+emit = em.emit_fn  # bind once; keeps attribute lookup out of the timed loop
 start = time.perf_counter()
 for _i in range(N):
-    em.emit_fn("bench", 1234)
+    emit("bench", 1234)
 end = time.perf_counter()
 
 dur = (end - start) / N
@@ -1,6 +1,7 @@
 """AsyncCollector: bounded, drop-oldest queue with background batch writer.
 
-- Non-blocking enqueue (drops oldest when full)
+- Non-blocking, lock-free enqueue (bounded deque drops oldest when full)
+- Optional discarding of low-value items once the buffer passes a threshold
 - Background writer thread batches and flushes to a provided sink
 - atexit handler drains remaining items
 
@@ -8,6 +9,8 @@ Configuration:
 - queue_size (int): max buffer size (default 2048)
 - flush_interval (float): seconds between periodic flush attempts (default 0.5s)
 - batch_max (int): maximum batch size per sink call (default 256)
+- discard (callable): predicate selecting items that may be discarded under pressure
+- discard_threshold (float): buffer fill ratio above which `discard` applies (default 0.8)
 """
 
 from __future__ import annotations
@@ -25,13 +28,15 @@ __all__ = ["AsyncCollector"]
 
 
 class AsyncCollector(Generic[T]):
-    def __init__(
+    def __init__(  # noqa: PLR0913
         self,
         sink: Callable[[list[T]], None],
         *,
         queue_size: int = 2048,
         flush_interval: float = 0.5,
         batch_max: int = 256,
+        discard: Callable[[T], bool] | None = None,
+        discard_threshold: float = 0.8,
         name: str = "profilis-collector",
     ) -> None:
         if queue_size <= 0:
@@ -40,14 +45,18 @@ class AsyncCollector(Generic[T]):
             raise ValueError("batch_max must be > 0")
         if flush_interval <= 0:
             raise ValueError("flush_interval must be > 0")
+        if not 0 < discard_threshold <= 1:
+            raise ValueError("discard_threshold must be in (0, 1]")
 
         self._sink = sink
-        self._buf: deque[T] = deque()
+        # deque.append/popleft are atomic under the GIL; maxlen evicts the oldest item
+        self._buf: deque[T] = deque(maxlen=int(queue_size))
         self._max = int(queue_size)
         self._batch_max = int(batch_max)
         self._interval = float(flush_interval)
+        self._discard = discard
+        self._discard_at = int(self._max * discard_threshold)
 
-        self._lock = threading.Lock()
         self._wakeup = threading.Event()
         self._stop = threading.Event()
         self._thread = threading.Thread(target=self._run, name=name, daemon=True)
@@ -55,8 +64,10 @@ class AsyncCollector(Generic[T]):
         # Stats (best-effort; not locked on read)
         self.enqueued = 0
         self.processed = 0
-        self.dropped_oldest = 0
+        self.discarded = 0
+        self.discard_errors = 0
         self.flush_errors = 0
+        self._popped = 0
 
         # Start worker and register atexit
         self._thread.start()
@@ -64,24 +75,37 @@ class AsyncCollector(Generic[T]):
 
     # -------------------------- Public API --------------------------
     def enqueue(self, item: T) -> None:
-        """Non-blocking enqueue.
+        """Non-blocking, lock-free enqueue.
 
-        If the buffer is full, drop the oldest item and append the new one.
-        This method never blocks on back-pressure.
+        If the buffer is full, the oldest item is evicted to make room. Once the
+        buffer is past `discard_threshold`, items matching `discard` are dropped
+        instead of enqueued. This method never blocks on back-pressure.
+
+        `discard` runs on the caller's thread, so keep it cheap. If it raises,
+        the item is kept and counted in `discard_errors`.
         """
-        with self._lock:
-            if len(self._buf) >= self._max:
-                # Drop-oldest
-                try:
-                    self._buf.popleft()
-                    self.dropped_oldest += 1
-                except IndexError:
-                    # Very unlikely race if another thread drained; ignore
-                    pass
-            self._buf.append(item)
-            self.enqueued += 1
-        # Nudge the writer to flush sooner
-        self._wakeup.set()
+        buf = self._buf
+        discard = self._discard
+        if discard is not None and len(buf) >= self._discard_at:
+            try:
+                drop = discard(item)
+            except Exception:
+                # A faulty predicate must not break the producer; keep the item
+                self.discard_errors += 1
+                drop = False
+            if drop:
+                self.discarded += 1
+                return
+        buf.append(item)
+        self.enqueued += 1
+        # Nudge the writer to flush sooner (is_set() is a plain read; set() takes a lock)
+        if not self._wakeup.is_set():
+            self._wakeup.set()
+
+    @property
+    def dropped_oldest(self) -> int:
+        """Items evicted by drop-oldest (derived; exact once producers are idle)."""
+        return max(0, self.enqueued - self._popped - len(self._buf))
 
     def close(self, *, timeout: float = 2.0) -> None:
         """Stop the background thread and flush any remaining items."""
@@ -122,12 +146,13 @@ class AsyncCollector(Generic[T]):
 
     def _pop_many(self, n: int) -> list[T]:
         items: list[T] = []
-        with self._lock:
-            for _ in range(min(n, len(self._buf))):
-                try:
-                    items.append(self._buf.popleft())
-                except IndexError:
-                    break
+        popleft = self._buf.popleft
+        for _ in range(n):
+            try:
+                items.append(popleft())
+            except IndexError:
+                break
+        self._popped += len(items)
         return items
 
     def _flush_batches(self) -> None:
@@ -18,26 +18,21 @@ class Emitter:
     def __init__(self, collector: AsyncCollector[dict[str, Any]]):
         self._collector = collector
 
-    def _base(self, kind: str) -> dict[str, Any]:
-        # Tiny dict, no dataclass conversion for hot path
+    def _base(self, kind: str, **extra: Any) -> dict[str, Any]:
+        # Shared keys first, then the per-kind fields, built as one dict literal
         return {
             "ts_ns": now_ns(),
             "trace_id": get_trace_id(),
             "span_id": get_span_id(),
             "kind": kind,
+            **extra,
         }
 
     def emit_req(self, route: str, status: int, dur_ns: int) -> None:
-        ev = self._base("REQ")
-        ev.update(route=route, status=status, dur_ns=dur_ns)
-        self._collector.enqueue(ev)
+        self._collector.enqueue(self._base("REQ", route=route, status=status, dur_ns=dur_ns))
 
     def emit_fn(self, name: str, dur_ns: int, error: bool = False) -> None:
-        ev = self._base("FN")
-        ev.update(fn=name, dur_ns=dur_ns, error=error)
-        self._collector.enqueue(ev)
+        self._collector.enqueue(self._base("FN", fn=name, dur_ns=dur_ns, error=error))
 
     def emit_db(self, query: str, dur_ns: int, rows: int) -> None:
-        ev = self._base("DB")
-        ev.update(query=query, dur_ns=dur_ns, rows=rows)
-        self._collector.enqueue(ev)
+        self._collector.enqueue(self._base("DB", query=query, dur_ns=dur_ns, rows=rows))
@@ -11,7 +11,8 @@ from __future__ import annotations
 
 import json
 from collections import deque
-from dataclasses import asdict, dataclass
+from dataclasses import dataclass, fields
+from operator import attrgetter
 
 from flask import Blueprint, Response, abort, request
 
@@ -29,6 +30,11 @@ class ErrorItem:
     traceback: str
 
 
+# Cached once: asdict() re-introspects fields() and deep-copies on every call
+_ERROR_FIELDS = tuple(f.name for f in fields(ErrorItem))
+_error_values = attrgetter(*_ERROR_FIELDS)
+
+
 class _ErrorRing:
     def __init__(self, maxlen: int = 200) -> None:
         self._buf: deque[ErrorItem] = deque(maxlen=maxlen)
@@ -37,7 +43,8 @@ class _ErrorRing:
         self._buf.append(item)
 
     def dump(self) -> list[dict[str, str | int | None]]:
-        return [asdict(x) for x in list(self._buf)][-50:]
+        # Convert only the entries returned, not the whole ring
+        return [dict(zip(_ERROR_FIELDS, _error_values(x))) for x in list(self._buf)[-50:]]
 
 
 # Singleton-ish registry (simple module-level reference)
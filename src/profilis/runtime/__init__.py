@@ -11,6 +11,7 @@ Public API surface exported here for convenience.
 
 from .clock import now_ns
 from .context import (
+    get_ids,
     get_span_id,
     get_trace_id,
     reset_span_id,
@@ -22,6 +23,7 @@ from .context import (
 from .ids import span_id
 
 __all__ = [
+    "get_ids",
     "get_span_id",
     "get_trace_id",
     "now_ns",
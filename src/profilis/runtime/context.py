@@ -6,11 +6,10 @@ Provides minimal helpers + a context manager for ergonomic usage without locks.
 
 from __future__ import annotations
 
-from collections.abc import Iterator
-from contextlib import contextmanager
 from contextvars import ContextVar, Token
 
 __all__ = [
+    "get_ids",
     "get_span_id",
     "get_trace_id",
     "reset_span_id",
@@ -34,6 +33,16 @@ def get_span_id() -> str | None:
     return _SPAN_ID.get()
 
 
+def get_ids() -> tuple[str | None, str | None]:
+    """Return (trace_id, span_id) in one call.
+
+
+    A convenience for reading both IDs together; each is still its own
+    ContextVar lookup, so it is not cheaper than the two getters.
+    """
+    return _TRACE_ID.get(), _SPAN_ID.get()
+
+
 # --- Setters returning tokens for manual reset ---
 def set_trace_id(value: str | None) -> Token[str | None]:
     return _TRACE_ID.set(value)
@@ -55,23 +64,53 @@ def reset_span_id(token: Token[str | None]) -> None:
 
 
 # --- Ergonomic context manager ---
-@contextmanager
-def use_span(trace_id: str | None = None, span_id: str | None = None) -> Iterator[None]:
+class _UseSpan:
+    """Sets trace/span IDs on enter and resets them on exit.
+
+
+    A plain class instead of @contextmanager: no generator frame per `with`.
+    Supports both `with` and `async with`. Not re-entrant: entering an instance
+    that is already active raises RuntimeError (create one per `with`).
+    """
+
+    __slots__ = ("_sid", "_stoken", "_tid", "_ttoken")
+
+    def __init__(self, trace_id: str | None, span_id: str | None) -> None:
+        self._tid = trace_id
+        self._sid = span_id
+        self._ttoken: Token[str | None] | None = None
+        self._stoken: Token[str | None] | None = None
+
+    def __enter__(self) -> None:
+        if self._ttoken is not None or self._stoken is not None:
+            # A second set would overwrite the held tokens and break the resets
+            raise RuntimeError("use_span() context is already active")
+        if self._tid is not None:
+            self._ttoken = _TRACE_ID.set(self._tid)
+        if self._sid is not None:
+            self._stoken = _SPAN_ID.set(self._sid)
+
+    def __exit__(self, *exc: object) -> None:
+        # Reset only what we set, in reverse order
+        if self._stoken is not None:
+            _SPAN_ID.reset(self._stoken)
+            self._stoken = None
+        if self._ttoken is not None:
+            _TRACE_ID.reset(self._ttoken)
+            self._ttoken = None
+
+    async def __aenter__(self) -> None:
+        self.__enter__()
+
+    async def __aexit__(self, *exc: object) -> None:
+        self.__exit__()
+
+
+def use_span(trace_id: str | None = None, span_id: str | None = None) -> _UseSpan:
     """Temporarily set trace/span IDs (async-safe). Resets on exit.
 
 
-    Parameters may be None to leave a value unchanged.
+    Parameters may be None to leave a value unchanged. Usable with `with`
+    and `async with`.
     """
-    ttoken = stoken = None
-    try:
-        if trace_id is not None:
-            ttoken = set_trace_id(trace_id)
-        if span_id is not None:
-            stoken = set_span_id(span_id)
-        yield
-    finally:
-        # Reset only what we set
-        if stoken is not None:
-            reset_span_id(stoken)
-        if ttoken is not None:
-            reset_trace_id(ttoken)
+    return _UseSpan(trace_id, span_id)
@@ -6,19 +6,26 @@
 
 from __future__ import annotations
 
-import secrets
+from os import urandom
 
 __all__ = ["span_id"]
 
+_ZERO64 = bytes(8)
 
-def _rand64() -> int:
-    """Fast, cryptographically strong 64-bit random int (no locks).
 
+def _rand64() -> bytes:
+    """Fast, cryptographically strong 64 random bits (no locks).
 
-    secrets uses os.urandom under the hood, which is non-blocking on modern
-    platforms once initialized. This avoids any Python-level locks on the hot path.
+
+    os.urandom is a single C call (getrandom on Linux), non-blocking on modern
+    platforms once initialized; secrets.* only wraps it in extra Python frames.
+    Not pooled: a pre-fetched buffer would be duplicated into forked workers.
     """
-    return secrets.randbits(64)
+    b = urandom(8)
+    # Avoid the rare all-zero value which some systems interpret as "unset"
+    while b == _ZERO64:
+        b = urandom(8)
+    return b
 
 
 def span_id() -> str:
@@ -27,8 +34,4 @@ def span_id() -> str:
 
     Ensures the ID is non-zero to avoid sentinel collisions in downstream systems.
     """
-    n = _rand64()
-    # Avoid the rare all-zero value which some systems interpret as "unset"
-    while n == 0:
-        n = _rand64()
-    return f"{n:016x}"
+    return _rand64().hex()
@@ -68,3 +68,62 @@ def test_atexit_handler_is_safe_to_call() -> None:
     # Everything should be drained or accounted as dropped
     assert col.processed + col.dropped_oldest == col.enqueued
     assert len(received) == col.processed
+
+
+def test_discard_predicate_applies_past_threshold() -> None:
+    received = []
+    started = threading.Event()
+    release = threading.Event()
+
+    def sink(batch: list[int]) -> None:
+        # Hold the writer on its first batch so the buffer fills deterministically
+        started.set()
+        release.wait(timeout=2.0)
+        received.extend(batch)
+
+    col = AsyncCollector(
+        sink,
+        queue_size=10,
+        flush_interval=0.05,
+        batch_max=10,
+        discard=lambda i: i % 2 == 0,
+        discard_threshold=0.5,
+    )
+    col.enqueue(-1)
+    assert started.wait(timeout=2.0)
+
+    for i in range(10):
+        col.enqueue(i)
+    release.set()
+    col.close()
+
+    # Past 5 buffered items, even (discardable) items are dropped; odd ones still land
+    expected = [-1, 0, 1, 2, 3, 4, 5, 7, 9]
+    assert received == expected
+    assert col.discarded == len([6, 8])
+    assert col.enqueued == len(expected)
+    assert col.processed + col.dropped_oldest == col.enqueued
+
+
+def test_discard_predicate_error_keeps_item() -> None:
+    received: list[int] = []
+
+    def discard(i: int) -> bool:
+        raise ValueError("bad predicate")
+
+    # Threshold rounds down to 0 buffered items, so the predicate runs on every enqueue
+    col = AsyncCollector(
+        received.extend,
+        queue_size=10,
+        flush_interval=0.05,
+        batch_max=10,
+        discard=discard,
+        discard_threshold=0.05,
+    )
+    for i in range(3):
+        col.enqueue(i)
+    col.close()
+
+    assert received == [0, 1, 2]
+    assert col.discard_errors == len(received)
+    assert col.discarded == 0
@@ -42,3 +42,23 @@ def test_emitter_enqueue(monkeypatch: Any) -> None:
     assert any(ev["kind"] == "REQ" for ev in received)
     assert any(ev["kind"] == "FN" for ev in received)
     assert any(ev["kind"] == "DB" for ev in received)
+
+
+def test_emitter_event_keys_and_order() -> None:
+    received: list[Any] = []
+    col = AsyncCollector[dict[str, Any]](
+        received.extend, queue_size=32, flush_interval=0.01, batch_max=8
+    )
+    em = Emitter(col)
+    em.emit_req("/home", 200, 1000)
+    em.emit_fn("work", 2000, error=True)
+    em.emit_db("SELECT 1", 3000, rows=1)
+    col.close()
+
+    base = ["ts_ns", "trace_id", "span_id", "kind"]
+    assert [list(ev) for ev in received] == [
+        [*base, "route", "status", "dur_ns"],
+        [*base, "fn", "dur_ns", "error"],
+        [*base, "query", "dur_ns", "rows"],
+    ]
+    assert [ev["kind"] for ev in received] == ["REQ", "FN", "DB"]
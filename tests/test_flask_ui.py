@@ -5,7 +5,7 @@ from typing import Union
 from flask import Flask
 
 from profilis.core.stats import StatsStore
-from profilis.flask.ui import ErrorItem, make_ui_blueprint, record_error
+from profilis.flask.ui import ErrorItem, _ErrorRing, make_ui_blueprint, record_error
 
 # HTTP status codes
 HTTP_OK = 200
@@ -66,3 +66,19 @@ def test_errors_ring_endpoint() -> None:
     assert r.status_code == HTTP_OK
     data = json.loads(r.data)
     assert "errors" in data and any(e["route"] == "/boom" for e in data["errors"])
+
+
+def test_error_ring_dump_returns_latest_as_dicts() -> None:
+    ring = _ErrorRing(maxlen=200)
+    for i in range(120):
+        ring.record(ErrorItem(i, f"/r{i}", 500, None, "v", "tb"))
+    dumped = ring.dump()
+    assert [e["ts_ns"] for e in dumped] == list(range(70, 120))
+    assert dumped[-1] == {
+        "ts_ns": 119,
+        "route": "/r119",
+        "status": 500,
+        "exception_type": None,
+        "exception_value": "v",
+        "traceback": "tb",
+    }
@@ -4,6 +4,7 @@ from typing import Optional
 import pytest
 
 from profilis.runtime.context import (
+    get_ids,
     get_span_id,
     get_trace_id,
     use_span,
@@ -30,6 +31,27 @@ def test_context_manager_sets_and_resets_sync() -> None:
     assert get_trace_id() is None and get_span_id() is None
 
 
+def test_use_span_only_touches_given_ids() -> None:
+    with use_span(trace_id="t1", span_id="s1"):
+        with use_span():
+            assert get_ids() == ("t1", "s1")
+        with use_span(trace_id="t2"):
+            assert get_ids() == ("t2", "s1")
+        with use_span(span_id="s2"):
+            assert get_ids() == ("t1", "s2")
+        assert get_ids() == ("t1", "s1")
+    assert get_ids() == (None, None)
+
+
+def test_get_ids_returns_both_values() -> None:
+    assert get_ids() == (None, None)
+    with use_span(trace_id="t1", span_id="s1"):
+        assert get_ids() == ("t1", "s1")
+        with use_span(span_id="s2"):
+            assert get_ids() == ("t1", "s2")
+    assert get_ids() == (None, None)
+
+
 @pytest.mark.asyncio
 async def test_context_propagation_across_awaits() -> None:
     async def task_one() -> None:
@@ -57,3 +79,26 @@ async def test_context_is_task_local() -> None:
         worker("A", "tX", "sX"),
         worker("B", "tY", "sY"),
     )
+
+
+@pytest.mark.asyncio
+async def test_use_span_supports_async_with() -> None:
+    async with use_span(trace_id="tA", span_id="sA"):
+        await _leaf_expect("tA", "sA")
+    assert get_ids() == (None, None)
+
+
+def test_use_span_resets_on_exception() -> None:
+    with pytest.raises(RuntimeError), use_span(trace_id="t1", span_id="s1"):
+        raise RuntimeError("boom")
+    assert get_ids() == (None, None)
+
+
+def test_use_span_rejects_reentry() -> None:
+    span = use_span(trace_id="t1", span_id="s1")
+    with span:
+        with pytest.raises(RuntimeError), span:
+            pass
+        # The outer block still holds its values and resets them cleanly
+        assert get_ids() == ("t1", "s1")
+    assert get_ids() == (None, None)